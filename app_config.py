@@ -65,6 +65,7 @@ _DEBUG_https_dis = False
 _DEBUG_max_rest = None
 _DEBUG_ka_en = True
 _DEBUG_ka_dis = False
+_DEBUG_skip_match = False
 _DEBUG_d = False  # When True, all content and responses are formatted and printed (pprint).
 _DEBUG_log = '_logs'
 _DEBUG_nl = False
@@ -85,10 +86,12 @@ def _get_input():
     :rtype sec: str, None
     :return content: Content for "running/brocade-chassis/management-interface-configuration".
     :rtype content: dict
+    :return skip_match: When True, parameters already set to the requested value are not sent to the switch.
+    :rtype skip_match: bool
     """
     global _DEBUG_ip, _DEBUG_id, _DEBUG_pw, _DEBUG_s, _DEBUG_rest_en, _DEBUG_rest_dis
     global _DEBUG_https_en, _DEBUG_https_dis, _DEBUG_max_rest, _DEBUG_ka_en, _DEBUG_ka_en
-    global _DEBUG_d, _DEBUG_log, _DEBUG_nl
+    global _DEBUG_d, _DEBUG_log, _DEBUG_nl, _DEBUG_skip_match
 
     ec = 0
 
@@ -96,8 +99,8 @@ def _get_input():
         args_ip, args_id, args_pw, args_s = _DEBUG_ip, _DEBUG_id, _DEBUG_pw, 'none' if _DEBUG_s is None else _DEBUG_s
         args_rest_en, args_rest_dis, args_https_en, args_https_dis = \
             _DEBUG_rest_en, _DEBUG_rest_dis, _DEBUG_https_en, _DEBUG_https_dis
-        args_max_rest, args_ka_en, args_ka_dis = \
-            _DEBUG_max_rest, _DEBUG_ka_en, _DEBUG_ka_dis
+        args_max_rest, args_ka_en, args_ka_dis, args_skip_match = \
+            _DEBUG_max_rest, _DEBUG_ka_en, _DEBUG_ka_dis, _DEBUG_skip_match
         args_d, args_log, args_nl = _DEBUG_d, _DEBUG_log, _DEBUG_nl
     else:
         buf = 'Useful as a programming example only on how to read and make chassis configuration changes via the '\
@@ -118,11 +121,16 @@ def _get_input():
                             required=False)
         parser.add_argument('-max_rest',
                             help='(Optional) Set the maximum number of REST sessions. Valid options are 1-10',
+                            type=int,
                             required=False)
         parser.add_argument('-ka_en', help='(Optional) No parameters. Enable keep-alive', action='store_true',
                             required=False)
         parser.add_argument('-ka_dis', help='(Optional) No parameters. Disable keep-alive', action='store_true',
                             required=False)
+        buf = '(Optional) No parameters. When set, parameters already set to the requested value are not sent. If ' \
+              'all requested values already match, the PATCH and the read back after changes are skipped. The ' \
+              'default is to always send the requested values and read them back as confirmation.'
+        parser.add_argument('-skip_match', help=buf, action='store_true', required=False)
         buf = '(Optional) Enable debug logging. Prints the formatted data structures (pprint) to the log and console.'
         parser.add_argument('-d', help=buf, action='store_true', required=False)
         buf = '(Optional) Directory where log file is to be created. Default is to use the current directory. The log' \
@@ -135,7 +143,8 @@ def _get_input():
         args_ip, args_id, args_pw, args_s = args.ip, args.id, args.pw, 'none' if args.s is None else args.s
         args_rest_en, args_rest_dis, args_https_en, args_https_dis = \
             args.rest_en, args.rest_dis, args.https_en, args.https_dis
-        args_max_rest, args_ka_en, args_ka_dis = args.max_rest, args.ka_en, args.ka_dis
+        args_max_rest, args_ka_en, args_ka_dis, args_skip_match = \
+            args.max_rest, args.ka_en, args.ka_dis, args.skip_match
         args_d, args_log, args_nl = args.d, args.log, args.nl
 
     # Set up the log file
@@ -163,6 +172,7 @@ def _get_input():
     ml.append('Enable keep-alive, -ka_en:    ' + str(args_ka_en))
     ml.append('Disable keep-alive, -ka_dis:  ' + str(args_ka_dis))
     ml.append('Max Rest sessions, -max_rest: ' + str(args_max_rest))
+    ml.append('Skip matching, -skip_match:   ' + str(args_skip_match))
 
     # Validate the input and set up the return dictionary
     if args_rest_en and args_rest_dis:
@@ -174,11 +184,14 @@ def _get_input():
     if args_ka_en and args_ka_dis:
         ml.append('-ka_en and -ka_dis are mutually exclusive.')
         ec = -1
+    if args_max_rest is not None and (args_max_rest < 1 or args_max_rest > 10):
+        ml.append('-max_rest must be an integer in the range 1-10.')
+        ec = -1
     if len(rd) == 0:
         ml.extend(['', 'No changes'])
     brcdapi_log.log(ml, True)
 
-    return ec, args_ip, args_id, args_pw, args_s, rd
+    return ec, args_ip, args_id, args_pw, args_s, rd, args_skip_match
 
 
 def pseudo_main():
@@ -190,7 +203,7 @@ def pseudo_main():
     global _DEBUG
 
     # Get and validate command line input
-    ec, ip, user_id, pw, sec, input_d = _get_input()
+    ec, ip, user_id, pw, sec, input_d, skip_match = _get_input()
     if ec != 0:
         return ec
 
@@ -218,10 +231,12 @@ def pseudo_main():
 
         if ec == 0:
 
-            # Make the changes
+            # Make the changes. With -skip_match, parameters already set to the requested value are skipped so that
+            # if nothing needs to change, the PATCH and the read back after changes are not sent.
+            current_d = obj.get('management-interface-configuration', dict())
             content_d = dict()
             for k, v in input_d.items():
-                if v is not None:
+                if v is not None and not (skip_match and current_d.get(k) == v):
                     content_d.update({k: v})
             if len(content_d) == 0:
                 brcdapi_log.log('No changes to make.', True)
@@ -244,17 +259,17 @@ def pseudo_main():
                     else:
                         brcdapi_log.log(pprint.pformat(obj), True)
 
-    except BaseException as e:
+    except Exception as e:
         brcdapi_log.exception('Programming error encountered. Exception is: ' + str(e), True)
         ec = -1
 
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if fos_auth.is_error(obj):
-        brcdapi_log.log('Logout failed', True)
-        ec = -1
-    else:
-        brcdapi_log.log('Logout succeeded', True)
+    finally:  # Logout
+        obj = brcdapi_rest.logout(session)
+        if fos_auth.is_error(obj):
+            brcdapi_log.log('Logout failed', True)
+            ec = -1
+        else:
+            brcdapi_log.log('Logout succeeded', True)
 
     return ec
 
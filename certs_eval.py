@@ -114,6 +114,7 @@ __version__ = '4.0.0'
 
 import datetime
 import argparse
+import os
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 import urllib3
@@ -157,6 +158,18 @@ _begin_obj = '-----BEGIN'
 _end_obj = '-----END'
 _end = '-----'
 _alt_name = {'subject-alternative-name-dns-names': 'dns-name', 'subject-alternative-name-ip-addresses': 'ip-address'}
+_csr_defaults = {  # Used in _generate_csr() when a value is not in the input workbook. Put your own defaults in here
+    'algorithm-type': 'rsa',
+    'key-size': '2048',
+    'hash-type': 'sha256',
+    'years': 1,
+    'country-name': 'US',
+    'state-name': 'CA',
+    'locality-name': 'San Jose',
+    'organization-name': 'Pre Sales',
+    'unit-name': 'BSN',
+    'domain-name': 'brm.bsnlab.broadcom.net',
+}
 """The key in _report_defaults below is the report column header. The associated dictionary is defined as follows:
 +-------+-------+---------------------------------------------------------------------------------------------------+
 | key   | type  | Description                                                                                       |
@@ -226,26 +239,30 @@ def _extract_certificate(file):
 
     # Read the file
     try:
-        f = open(file, 'rb')
-        # FOS only accepts Unix style new lines
-        buf = f.read().decode(brcdapi_util.encoding_type, errors='ignore').replace('\r', '')
-        f.close()
+        with open(file, 'rb') as f:
+            # FOS only accepts Unix style new lines
+            buf = f.read().decode(brcdapi_util.encoding_type, errors='ignore').replace('\r', '')
     except FileNotFoundError:
         brcdapi_log.log('  File not found: ' + file, True)
         return None
 
-    # Parse out just the certificates & keys
-    r_buf, begin_i = '', buf.find(_begin_obj)
+    # Parse out just the certificates & keys. Rather than slicing off what has already been parsed, start_i is the index
+    # into buf where the search for the next certificate begins.
+    r_buf, start_i = '', 0
+    begin_i = buf.find(_begin_obj)
     while begin_i >= 0:
-        end_i = buf.find(_end_obj)
+        end_i = buf.find(_end_obj, start_i)
         if end_i < begin_i:
             brcdapi_log.log('Corrupted PEM file. Mismatched ' + _begin_obj + ' and ' + _end_obj + ' in ' + file, True)
             return None
-        end_i += len(_end_obj)
-        end_i += buf[end_i:].find(_end) + len(_end)
+        end_i = buf.find(_end, end_i + len(_end_obj))
+        if end_i < 0:
+            brcdapi_log.log('Corrupted PEM file. Missing trailing ' + _end + ' after ' + _end_obj + ' in ' + file, True)
+            return None
+        end_i += len(_end)
         r_buf += buf[begin_i: end_i] + '\n'  # I don't think FOS needs this '\n' but it makes it easier to read
-        buf = buf[end_i:]
-        begin_i = buf.find(_begin_obj)
+        start_i = end_i
+        begin_i = buf.find(_begin_obj, start_i)
 
     return r_buf if len(r_buf) > 0 else None
 
@@ -263,34 +280,29 @@ def _matching_param(param_l, cert_d):
     global _cert_keys
 
     for param_d in param_l:
-        match_count = 0
-        for key in _cert_keys:
-            if cert_d.get(key) is not None and param_d.get(key) is not None and cert_d.get(key) == param_d.get(key):
-                match_count += 1
-                if match_count == len(_cert_keys):
-                    return param_d
+        # all() stops checking at the first key that doesn't match. If the value in cert_d isn't None and it matches,
+        # the value in param_d isn't None either.
+        if all(cert_d.get(key) is not None and cert_d.get(key) == param_d.get(key) for key in _cert_keys):
+            return param_d
 
     return None
 
 
-def _matching_cert(cert_l, param_d):
-    """A utilitarian method to find a parameter that matches a certificate returned in the API
+def _cert_index(cert_l):
+    """A utilitarian method to build a look up table used to find the certificate that matches a parameter
+
+    Use: cert_d = _cert_index(cert_l).get((param_d['certificate-entity'], param_d['certificate-type']))
 
     :param cert_l: List of certificates ('certs_l' in input_d returned from _get_certs() as returned from the API)
-    :type cert_l: list
-    :param param_d: The parameter as returned from the _get_inputs in input_d['param_l']
-    :type param_d: dict
-    :return: The dictionary entry in certs_l that matches the certificate in cert_d. None if not found.
-    :rtype: dict, None
+    :type cert_l: list, None
+    :return: Key is the tuple (certificate-entity, certificate-type). Value is the matching dictionary in cert_l
+    :rtype: dict
     """
-    global _cert_keys
+    rd = dict()
+    for cert_d in gen_util.convert_to_list(cert_l):
+        rd.setdefault((cert_d['certificate-entity'], cert_d['certificate-type']), cert_d)  # Keep the first match
 
-    for cert_d in cert_l:
-        if cert_d['certificate-entity'] == param_d['certificate-entity'] and \
-                cert_d['certificate-type'] == param_d['certificate-type']:
-            return cert_d
-
-    return None
+    return rd
 
 
 def _certs_filter(switch_d, filter_type):
@@ -328,7 +340,7 @@ def _create_report(input_d, report_type):
     report = input_d.get('_report')
     if report is None:
         return
-    report_name = report[0: len(report)-len('.xlsx')] + '_' + _report_names[report_type] + '.xlsx'
+    report_name = os.path.splitext(report)[0] + '_' + _report_names[report_type] + '.xlsx'
     wb = xl.Workbook()
     sheet = wb.create_sheet(index=0, title='parameters')
 
@@ -361,13 +373,14 @@ def _create_report(input_d, report_type):
             # cert_control that is used to determine if a cert is missing or needs to be updated.
             filtered_switch_l = [c for c in switch_d['_certs_l'] if c['cert_control'][_report_names[report_type]]]
             if len(filtered_switch_l) > 0:
-                filtered_switch_d = dict(_certs_l=filtered_switch_l)
-                for k, v in switch_d.items():
-                    if k != '_certs_l':
-                        filtered_switch_d.update({k: v})
+                filtered_switch_d = {k: v for k, v in switch_d.items() if k != '_certs_l'}
+                filtered_switch_d.update(_certs_l=filtered_switch_l)
                 switch_l.append(filtered_switch_d)
 
-    # Format the content of switch_l into dictionaries formatted for the workbook. These are added to report_l
+    # Format the content of switch_l into dictionaries formatted for the workbook. These are added to report_l. The
+    # parameter keys to report don't change so they are determined once rather than for each certificate.
+    skip_keys = _cert_keys + _expiration_keys
+    report_param_keys = [p_key for p_key in _param_keys + _alt_names if p_key not in skip_keys]
     for switch_d in switch_l:
         report_d = dict()
         for key in _login_keys:  # Login credentials are only added to the report once for each switch.
@@ -384,11 +397,10 @@ def _create_report(input_d, report_type):
             param_d = _matching_param(switch_d['_params_l'], cert_d)
             if param_d is None:
                 param_d = dict()
-            for p_key in _param_keys + _alt_names:
-                if p_key not in _cert_keys + _expiration_keys:
-                    buf = param_d.get(p_key) if report_type == _REPORT_TYPE_FULL else \
-                        _report_defaults[p_key]['v'] if param_d.get(p_key) is None else _report_defaults[p_key]['v']
-                    report_d.update(({p_key: buf}))
+            for p_key in report_param_keys:
+                buf = param_d.get(p_key) if report_type == _REPORT_TYPE_FULL else \
+                    _report_defaults[p_key]['v'] if param_d.get(p_key) is None else _report_defaults[p_key]['v']
+                report_d.update(({p_key: buf}))
             report_l.append(report_d.copy())
             report_d = dict()
 
@@ -419,8 +431,12 @@ def _eval_certs(switch_d):
     """
     global _SECONDS_PER_DAY
 
+    # Good enough for time measured in days so the current time is only read once for all certificates
+    now = datetime.datetime.now().timestamp()
+
+    cert_index_d = _cert_index(switch_d['_certs_l'])
     for param_d in switch_d['_params_l']:  # For each certificate defined in the input workbook
-        cert_d = _matching_cert(switch_d['_certs_l'], param_d)  # Find the matching cert
+        cert_d = cert_index_d.get((param_d['certificate-entity'], param_d['certificate-type']))  # The matching cert
         if cert_d is None:
             # I'm not validating what was put in the workbook. Keep in mind, using the workbook was an expedient for
             # testing purposes. The normal reason for not finding a match is when the action is "eval" but no parameters
@@ -433,7 +449,7 @@ def _eval_certs(switch_d):
         if isinstance(param_d.get('days'), int):
             expire = cert_d['cert_control'].get('expires_epoch')
             if isinstance(expire, float):
-                if expire - datetime.datetime.now().timestamp() - param_d['days']*_SECONDS_PER_DAY <= 0:
+                if expire - now - param_d['days']*_SECONDS_PER_DAY <= 0:
                     cert_d['cert_control']['update'] = True
             else:
                 cert_d['cert_control']['missing'] = True
@@ -484,23 +500,15 @@ def _generate_csr(session, param_d):
     :return: True: Successfully generated the CSR. False: An error occured while attempting to generate the CSR.
     :rtype: bool
     """
-    global _alt_name
-
-    sub_content = {  # Put your own defaults in here
-        'certificate-entity': 'csr',
-        'certificate-type': param_d['certificate-type'],
-        'algorithm-type': 'rsa' if param_d.get('algorithm-type') is None else param_d.get('algorithm-type'),
-        'key-size': '2048' if param_d.get('key-size') is None else str(param_d.get('key-size')),
-        'hash-type': 'sha256' if param_d.get('hash-type') is None else param_d.get('hash-type'),
-        'years': 1 if param_d.get('years') is None else param_d.get('years'),
-        'country-name': 'US' if param_d.get('country-name') is None else param_d.get('country-name'),
-        'state-name': 'CA' if param_d.get('state-name') is None else param_d.get('state-name'),
-        'locality-name': 'San Jose' if param_d.get('locality-name') is None else param_d.get('locality-name'),
-        'organization-name': 'Pre Sales' if param_d.get('organization-name') is None else \
-            param_d.get('organization-name'),
-        'unit-name': 'BSN' if param_d.get('unit-name') is None else param_d.get('unit-name'),
-        'domain-name': 'brm.bsnlab.broadcom.net' if param_d.get('domain-name') is None else param_d.get('domain-name')
-    }
+    global _alt_name, _csr_defaults
+
+    sub_content = {'certificate-entity': 'csr', 'certificate-type': param_d['certificate-type']}
+    # The keys in param_d are always present but the value is None if it wasn't in the workbook so dict.get() with a
+    # default doesn't work here.
+    for key, default in _csr_defaults.items():
+        v = param_d.get(key)
+        sub_content.update({key: default if v is None else v})
+    sub_content.update({'key-size': str(sub_content['key-size'])})
     # Add optional subject alternatives
     for key, sub_key in _alt_name.items():
         alt_subj = param_d.get(key)
@@ -616,9 +624,10 @@ def _add_cert_action(switch_d):
         if isinstance(cert_file, str) and len(cert_file) > 0:
             csr_file = brcdapi_file.full_file_name(cert_file, '.pem')
             cert_entity, cert_type = param_d['certificate-entity'], param_d['certificate-type']
-            brcdapi_log.log('  Adding ' + csr_file + ' for ' + cert_entity + ', ' + cert_type, True)
+            buf = csr_file + ' for ' + cert_entity + ', ' + cert_type
+            brcdapi_log.log('  Adding ' + buf, True)
             if _add_cert(switch_d['_session'], cert_entity, cert_type, csr_file):
-                brcdapi_log.log('  Successfully added ' + csr_file + ' for ' + cert_entity + ', ' + cert_type, True)
+                brcdapi_log.log('  Successfully added ' + buf, True)
         else:
             brcdapi_log.log('  Missing cert file for ' + param_d['certificate-entity'] + ', ' +
                             param_d['certificate-type'], True)
@@ -629,12 +638,20 @@ def _del_cert_action(switch_d):
     session = switch_d['_session']
     param_l = switch_d['_params_l']
 
-    # If other certs are present, delete the cert (private key) first, then the public keys, then the CSR.
-    ordered_l = [param_d for param_d in param_l if param_d['certificate-entity'] == 'cert']
-    ordered_l.extend([param_d for param_d in param_l if param_d['certificate-entity'] in ('ca-server', 'ca-client')])
-    ordered_l.extend([param_d for param_d in param_l if param_d['certificate-entity'] == 'csr'])
-    for param_d in ordered_l:
-        cert_d = _matching_cert(switch_d['_certs_l'], param_d)
+    # If other certs are present, delete the cert (private key) first, then the public keys, then the CSR. The
+    # parameters are sorted into these groups in a single pass.
+    cert_l, ca_l, csr_l = list(), list(), list()
+    for param_d in param_l:
+        entity = param_d['certificate-entity']
+        if entity == 'cert':
+            cert_l.append(param_d)
+        elif entity in ('ca-server', 'ca-client'):
+            ca_l.append(param_d)
+        elif entity == 'csr':
+            csr_l.append(param_d)
+    cert_index_d = _cert_index(switch_d['_certs_l'])
+    for param_d in cert_l + ca_l + csr_l:
+        cert_d = cert_index_d.get((param_d['certificate-entity'], param_d['certificate-type']))
         if cert_d is None:
             continue  # This happens when there are alternative subject names because the entity & type are None
         param_entity = param_d['certificate-entity']
@@ -957,14 +974,9 @@ def _get_input():
                 new_switch, last_d = True, ip_d
 
             # Add the parameters for this switch. I missed alternative subject names so shoe horned them in afterwards
-            update_flag, temp_d = False, dict()
-            for key in _param_keys:  # Add the parameters
-                v = d.get(key)
-                if v is not None:
-                    update_flag = True
-                temp_d.update({key: v})
-            if update_flag or new_switch:
-                last_param_d = param_d = temp_d.copy()
+            temp_d = {key: d.get(key) for key in _param_keys}  # Add the parameters
+            if new_switch or any(v is not None for v in temp_d.values()):
+                last_param_d = param_d = temp_d  # temp_d is built new for each row so a copy isn't needed
                 for key in _alt_names:
                     param_d.update({key: list()})
                 ip_d['_params_l'].append(param_d)
@@ -1011,11 +1023,10 @@ def pseudo_main():
         try:  # This try is to ensure the logout code gets executed regardless of what happens.
             switch_d['_certs_l'] = _get_certs(switch_d)  # Get and add the list of certs to switch_d
             _valid_actions[input_d['_action']]['a'](switch_d)
-        except BaseException as e:
+        except Exception as e:
             brcdapi_log.exception('Programming error encountered. Exception is: ' + str(e), True)
-
-        # Logout
-        _logout(switch_d)  # Error messages, if any, are logged in _logout()
+        finally:  # Logout
+            _logout(switch_d)  # Error messages, if any, are logged in _logout()
 
     return ec
 
@@ -185,25 +185,27 @@ def pseudo_main():
     brcdapi_log.log('Attempting login', True)
     session = brcdapi_rest.login(user_id, pw, ip_addr, sec)
     if fos_auth.is_error(session):
-        brcdapi_log.log('Login failed. Error message is:', True)
-        brcdapi_log.log(fos_auth.formatted_error_msg(session), True)
+        brcdapi_log.log(['Login failed. Error message is:', fos_auth.formatted_error_msg(session)], True)
         return -1
     brcdapi_log.log(['Login succeeded', 'Getting certificates. This will take about 30 sec.'], True)
 
+    ec = 0
     try:  # This try is to ensure the logout code gets executed regardless of what happened.
         # Get the certificates from the API
         cert_obj = brcdapi_rest.get_request(session, 'running/brocade-security/security-certificate')
-    except BaseException as e:
+    except Exception as e:
         brcdapi_log.exception('Unexpected error encountered. Exception is: ' + str(e), True)
-
-    # Logout
-    brcdapi_log.log('Attempting logout', True)
-    obj = brcdapi_rest.logout(session)
-    if fos_auth.is_error(obj):
-        brcdapi_log.log('Logout failed. Error message is:', True)
-        brcdapi_log.log(fos_auth.formatted_error_msg(obj), True)
-        return -1
-    brcdapi_log.log('Logout succeeded.', True)
+        ec = -1
+    finally:  # Logout
+        brcdapi_log.log('Attempting logout', True)
+        obj = brcdapi_rest.logout(session)
+        if fos_auth.is_error(obj):
+            brcdapi_log.log(['Logout failed. Error message is:', fos_auth.formatted_error_msg(obj)], True)
+            ec = -1
+        else:
+            brcdapi_log.log('Logout succeeded.', True)
+    if ec != 0:
+        return ec
 
     # Display the certificates
     if fos_auth.is_error(cert_obj):
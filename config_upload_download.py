@@ -124,7 +124,6 @@ def _action_upload(param_d):
     try:
         with open(param_d['file'], 'w') as f:
             f.write(obj['configupload-operation-status']['config-output-buffer'])
-        f.close()
     except (FileExistsError, FileNotFoundError):
         el.append('The path specified in ' + param_d['file'] + ' does not exist.')
     except PermissionError:
@@ -145,7 +144,6 @@ def _action_download(param_d):
     try:
         with open(param_d['file']) as f:
             config = f.read()
-        f.close()
 
     except FileNotFoundError:
         el.append('File ' + param_d['file'] + ' not found.')
@@ -337,16 +335,16 @@ def pseudo_main():
     try:  # I always do a try in code development so that if there is a code bug, I still log out.
         brcdapi_log.log(_action_tbl_d[param_d['action']](param_d), echo=True)
 
-    except BaseException as e:
+    except Exception as e:
         brcdapi_log.log(['Programming error encountered. Exception is:', pprint.pformat(e)], echo=True)
         ec = -1
 
-    # Logout
-    obj = brcdapi_rest.logout(param_d['session'])
-    if fos_auth.is_error(obj):
-        brcdapi_log.log(['Logout failed:', fos_auth.formatted_error_msg(obj)], echo=True)
-    else:
-        brcdapi_log.log('Logout succeeded', echo=True)
+    finally:  # Logout
+        obj = brcdapi_rest.logout(param_d['session'])
+        if fos_auth.is_error(obj):
+            brcdapi_log.log(['Logout failed:', fos_auth.formatted_error_msg(obj)], echo=True)
+        else:
+            brcdapi_log.log('Logout succeeded', echo=True)
 
     return ec
 
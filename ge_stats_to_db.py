@@ -45,11 +45,11 @@ __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
 __version__ = '4.0.1'
 
-import argparse
 import brcdapi.brcdapi_rest as brcdapi_rest
 import brcdapi.fos_auth as brcdapi_auth
 import brcdapi.util as brcdapi_util
 import brcdapi.log as brcdapi_log
+import brcdapi.gen_util as gen_util
 
 _DOC_STRING = False  # Should always be False. Prohibits any actual I/O. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -61,6 +61,8 @@ _input_d.update(fid=dict(t='int', v=gen_util.range_to_list('1-128'), h='Required
 _input_d.update(gen_util.parseargs_log_d.copy())
 _input_d.update(gen_util.parseargs_debug_d.copy())
 
+_key_trans = str.maketrans(':/', '__')  # Used in _db_add() to replace ':' and '/' in keys with '_'
+
 
 def _db_add(key_0, key_1, key_2, val):
     """Stubbed out method to add key value pairs to your database. Derives a unique key from a hash of the 3 input keys
@@ -82,13 +84,12 @@ def _db_add(key_0, key_1, key_2, val):
     # Verbose explanation of the next line of code:
     # key_list = list() - create a list to store the keys in
     # for key in (key_0, key_1, key_2):
-    #     clean_key = key.replace(':', '_').replace('/', '_') - Replace ':' and '/' with '_'
+    #     clean_key = key.translate(_key_trans) - Replace ':' and '/' with '_'
     #     short_key = clean_key[11:] - removes the non-unique portion of WWN in the key
     #     key_list.append(short_key) - Add the key to key_list
-    # For the Python savvy, a compiled regex would be better than .replace() above but this is good enough for a simple
-    # example. Using a regex probably won't save enough time to make researching it worthwhile so if you don't
-    # understand this comment, just stick with using .replace().
-    key_list = [key.replace(':', '_').replace('/', '_')[11:] for key in (key_0, key_1, key_2)]
+    # str.translate() replaces all the characters in _key_trans in a single pass over the string. It does the same thing
+    # as key.replace(':', '_').replace('/', '_') without creating an intermediate string for each replace.
+    key_list = [key.translate(_key_trans)[11:] for key in (key_0, key_1, key_2)]
 
     unique_key = '_'.join(key_list)  # Concatenates all items in key_list seperated by a '_'
     brcdapi_log.log('Adding key: ' + unique_key + ', Value: ' + str(val), True)
@@ -155,8 +156,7 @@ def pseudo_main(ip, user_id, pw, sec, fid):
             else:
                 # To make it easier to match the port information with the port statistics, we're going to create a
                 # dictionary using the port name (port number) as the key
-                for port_obj in port_info['fibrechannel']:
-                    port_info_d.update({port_obj['name']: port_obj})
+                port_info_d = {port_obj['name']: port_obj for port_obj in port_info['fibrechannel']}
 
         # Capture the port statistics
         if ec == 0:  # Make sure we didn't encounter any errors above
@@ -170,8 +170,7 @@ def pseudo_main(ip, user_id, pw, sec, fid):
                 # We could just add each port to the database here but since it's common to capture additional
                 # information, such as determining the login alias(es), we'll add it to a dictionary as was done with
                 # the basic port information
-                for port_obj in port_stats['fibrechannel-statistics']:
-                    port_stats_d.update({port_obj['name']: port_obj})
+                port_stats_d = {port_obj['name']: port_obj for port_obj in port_stats['fibrechannel-statistics']}
 
         # Add all the ports to the database
         if ec == 0:  # Make sure we didn't encounter any errors above
@@ -185,15 +184,14 @@ def pseudo_main(ip, user_id, pw, sec, fid):
     except brcdapi_util.VirtualFabricIdError:
         brcdapi_log.log('Software error. Search the log for "Invalid FID" for details.', echo=True)
         ec = -1
-    except BaseException as e:
+    except Exception as e:
         brcdapi_log.exception(['Programming error encountered.', str(type(e)) + ': ' + str(e)], echo=True)
         ec = -1
-
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if brcdapi_auth.is_error(obj):
-        brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
-        ec = -1
+    finally:  # Logout
+        obj = brcdapi_rest.logout(session)
+        if brcdapi_auth.is_error(obj):
+            brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
+            ec = -1
 
     return ec
 
@@ -237,7 +235,7 @@ def _get_input():
 ###################################################################
 if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
-    exit(brcddb_common.EXIT_STATUS_OK)
+    exit(0)
 
 if _STAND_ALONE:
     _ec = _get_input()
@@ -236,10 +236,7 @@ def pseudo_main():
     total_len = _LEN_VER + _REC_VER + _LEN_STATUS + _LEN_MOD + _LEN_DESC
     e_buf = '|  '
     for x in (_LEN_MOD, _LEN_STATUS, _LEN_VER, _REC_VER):
-        space = ''
-        for i in range(0, x - 1):
-            space = space + ' '
-        e_buf = e_buf + space + '|'
+        e_buf = e_buf + ' ' * (x - 1) + '|'
 
     # Check the Python version
     msg = '\nPython Version: '
@@ -260,9 +257,7 @@ def pseudo_main():
     print(msg)
 
     # Now generate a simple report to STD_OUT
-    s = '-'
-    for i in range(0, total_len + 1):
-        s = s + '-'
+    s = '-' * (total_len + 2)
     print(s)
     ol = [{'l': 'Module', 'd': 'Description', 'r': 'Rec Ver'}]
     ol.extend(_imports)
@@ -275,55 +270,36 @@ def pseudo_main():
                 buf = mod.get('d')
             else:
                 continue
-            space = ''
-            for i in range(0, total_len - len(buf) if total_len - len(buf) > 0 else 0):
-                space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (total_len - len(buf))
         else:
             obj = modules[mod.get('l')]
 
             # Module
             buf = mod.get('l')
-            space = ''
-            for i in range(0, _LEN_MOD - len(buf) if _LEN_MOD - len(buf) > 0 else 0):
-                space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (_LEN_MOD - len(buf))
 
             # Status
             buf = obj.get('i') if 'i' in obj else 'Unknown'
             buf = '| ' + buf
-            space = ''
-            for i in range(0, _LEN_STATUS - len(buf) if _LEN_STATUS - len(buf) > 0 else 0):
-                space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (_LEN_STATUS - len(buf))
 
             # Version
             buf = obj.get('v') if 'v' in obj else ''
             buf = '| ' + buf
-            space = ''
-            for i in range(0, _LEN_VER - len(buf) if _LEN_VER - len(buf) > 0 else 0):
-                space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (_LEN_VER - len(buf))
 
             # Recommended Version
             buf = mod.get('r') if 'r' in mod else ''
             buf = '| ' + buf
-            space = ''
-            for i in range(0, _REC_VER - len(buf) if _REC_VER - len(buf) > 0 else 0):
-                space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (_REC_VER - len(buf))
 
             # Description
-            space = ''
             buf = mod.get('d') if 'd' in mod else ''
             buf = '| ' + buf
             if len(buf) > _LEN_DESC:
                 extra_desc = buf[_LEN_DESC:]
                 buf = buf[:_LEN_DESC]
-            else:
-                for i in range(0, _LEN_DESC - len(buf) if _LEN_DESC - len(buf) > 0 else 0):
-                    space = space + ' '
-            print_buf = print_buf + buf + space
+            print_buf = print_buf + buf + ' ' * (_LEN_DESC - len(buf))
 
         print(print_buf + '|')
         while len(extra_desc) > 0:
@@ -333,8 +309,7 @@ def pseudo_main():
                 buf = buf[:_LEN_DESC - 1]
                 extra_desc = extra_desc[_LEN_DESC - 2:]
             else:
-                for i in range(1, _LEN_DESC - len(buf) if _LEN_DESC - len(buf) > 0 else 0):
-                    space = space + ' '
+                space = ' ' * (_LEN_DESC - len(buf) - 1)
                 extra_desc = ''
             print(e_buf + buf + space + '|')
         print(s)
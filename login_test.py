@@ -94,25 +94,23 @@ def pseudo_main():
     if not nl:
         brcdapi_log.open_log(log)
     ml = ['WARNING!!! Debug is enabled'] if _DEBUG else list()
-    ml.append('IP:          ' + brcdapi_util.mask_ip_addr(ip, True))
-    ml.append('ID:          ' + user_id)
-    ml.append('security:    ' + sec)
+    ml.extend(['IP:          ' + brcdapi_util.mask_ip_addr(ip, True),
+               'ID:          ' + user_id,
+               'security:    ' + sec,
+               'Attempting login'])
     brcdapi_log.log(ml, True)
 
     # Login
-    brcdapi_log.log('Attempting login', True)
     session = brcdapi_rest.login(user_id, pw, ip, sec)
     if brcdapi_auth.is_error(session):
-        brcdapi_log.log('Login failed. Error message is:', True)
-        brcdapi_log.log(brcdapi_auth.formatted_error_msg(session), True)
+        brcdapi_log.log(['Login failed. Error message is:', brcdapi_auth.formatted_error_msg(session)], True)
         return -1
 
     # Logout
     brcdapi_log.log('Login succeeded. Attempting logout', True)
     obj = brcdapi_rest.logout(session)
     if brcdapi_auth.is_error(obj):
-        brcdapi_log.log('Logout failed. Error message is:', True)
-        brcdapi_log.log(brcdapi_auth.formatted_error_msg(obj), True)
+        brcdapi_log.log(['Logout failed. Error message is:', brcdapi_auth.formatted_error_msg(obj)], True)
         return -1
     brcdapi_log.log('Logout succeeded.', True)
     return 1
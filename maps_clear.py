@@ -117,30 +117,34 @@ def pseudo_main():
         brcdapi_rest.verbose_debug = True
     if not nl:
         brcdapi_log.open_log(log)
-    fid = int(fids)
     ml.append('FID: ' + fids)
     if sec is None:
         sec = 'none'
+    fid = int(fids) if fids.isdecimal() else 0
+    if fid < 1 or fid > 128:
+        ml.append('Invalid FID, -fid. FID must be an integer between 1-128')
+        brcdapi_log.log(ml, True)
+        return -1
     brcdapi_log.log(ml, True)
 
     # Login
     brcdapi_log.log('Attempting login', True)
     session = brcdapi_rest.login(user_id, pw, ip, sec)
     if brcdapi_auth.is_error(session):
-        brcdapi_log.log('Login failed', True)
-        brcdapi_log.log(brcdapi_auth.formatted_error_msg(session), True)
+        brcdapi_log.log(['Login failed', brcdapi_auth.formatted_error_msg(session)], True)
         return -1
     brcdapi_log.log('Login succeeded', True)
 
     try:
         ec = _clear_dashboard(session, fid)
-    except:  # Base except because I don't care what went wrong, I just want to make sure we logout.
-        brcdapi_log.exception('Encountered a programming error', True)
+    except Exception as e:
+        brcdapi_log.exception(['Encountered a programming error', 'Exception: ' + str(e)], True)
         ec = -1
+    finally:  # I don't care what went wrong, I just want to make sure we logout.
+        obj = brcdapi_rest.logout(session)
+        if brcdapi_auth.is_error(obj):
+            brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
 
-    obj = brcdapi_rest.logout(session)
-    if brcdapi_auth.is_error(obj):
-        brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
     return ec
 
 
@@ -274,9 +274,7 @@ _action_tbl_d = dict(
     reserve=dict(a=_action_reserve, h='Reserves POD license for ports.'),
     release=dict(a=_action_release, h='Releases POD license for ports.'),
 )
-_help_pad_len = 0
-for _key in _action_tbl_d.keys():
-    _help_pad_len = max(_help_pad_len, len(_key)+2)
+_help_pad_len = max(len(_key) for _key in _action_tbl_d) + 2
 
 
 def _get_input():
@@ -459,17 +457,17 @@ def pseudo_main():
             else:
                 brcdapi_log.log('Successfully completed action: ' + action, echo=True)
 
-    except BaseException as e:
+    except Exception as e:
         e_buf = str(e, errors='ignore') if isinstance(e, (bytes, str)) else str(type(e))
         brcdapi_log.exception('Programming error encountered. Exception is: ' + e_buf, echo=True)
         ec = -1
 
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if brcdapi_auth.is_error(obj):
-        brcdapi_log.log(['Logout failed:', brcdapi_auth.formatted_error_msg(obj)], echo=True)
-    else:
-        brcdapi_log.log('Logout succeeded', echo=True)
+    finally:  # Logout
+        obj = brcdapi_rest.logout(session)
+        if brcdapi_auth.is_error(obj):
+            brcdapi_log.log(['Logout failed:', brcdapi_auth.formatted_error_msg(obj)], echo=True)
+        else:
+            brcdapi_log.log('Logout succeeded', echo=True)
 
     return ec
 
@@ -61,6 +61,8 @@ _DEBUG_verbose = False  # When True, all content and responses are formatted and
 _DEBUG_log = '_logs'
 _DEBUG_nl = False
 
+_key_trans = str.maketrans(':/', '__')  # Used in _db_add() to replace ':' and '/' in keys with '_'
+
 
 def _db_add(key_0, key_1, key_2, val):
     """Stubbed out method to add key value pairs to your database. Derives a unique key from a hash of the 3 input keys
@@ -82,13 +84,12 @@ def _db_add(key_0, key_1, key_2, val):
     # Verbose explanation of the next line of code:
     # key_list = list() - create a list to store the keys in
     # for key in (key_0, key_1, key_2):
-    #     clean_key = key.replace(':', '_').replace('/', '_') - Replace ':' and '/' with '_'
+    #     clean_key = key.translate(_key_trans) - Replace ':' and '/' with '_'
     #     short_key = clean_key[11:] - removes the non-unique portion of WWN in the key
     #     key_list.append(short_key) - Add the key to key_list
-    # For the Python savvy, a compiled regex would be better than .replace() above but this is good enough for a simple
-    # example. Using a regex probably won't save enough time to make researching it worthwhile so if you don't
-    # understand this comment, just stick with using .replace().
-    key_list = [key.replace(':', '_').replace('/', '_')[11:] for key in (key_0, key_1, key_2)]
+    # str.translate() replaces all the characters in _key_trans in a single pass over the string. It does the same thing
+    # as key.replace(':', '_').replace('/', '_') without creating an intermediate string for each replace.
+    key_list = [key.translate(_key_trans)[11:] for key in (key_0, key_1, key_2)]
 
     unique_key = '_'.join(key_list)  # Concatenates all items in key_list seperated by a '_'
     brcdapi_log.log('Adding key: ' + unique_key + ', Value: ' + str(val), True)
@@ -142,10 +143,11 @@ def pseudo_main():
     if not nl:
         brcdapi_log.open_log(log)
     ml.append('FID: ' + fid_str)
-    try:
-        fid = int(fid_str)
-    except ValueError:
-        brcdapi_log.log('Invalid FID, -f. FID must be an integer between 1-128')
+    fid = int(fid_str) if fid_str.isdecimal() else 0
+    if fid < 1 or fid > 128:
+        ml.append('Invalid FID, -fid. FID must be an integer between 1-128')
+        brcdapi_log.log(ml, True)
+        return -1
     brcdapi_log.log(ml, True)
 
     # Login
@@ -192,8 +194,7 @@ def pseudo_main():
             else:
                 # To make it easier to match the port information with the port statistics, we're going to create a
                 # a dictionary using the port name (port number) as the key
-                for port_obj in port_info['fibrechannel']:
-                    port_info_d.update({port_obj['name']: port_obj})
+                port_info_d = {port_obj['name']: port_obj for port_obj in port_info['fibrechannel']}
 
         # Capture the port statistics
         if ec == 0:  # Make sure we didn't encountered any errors above
@@ -207,8 +208,7 @@ def pseudo_main():
                 # We could just add each port to the database here but since it's common to capture additional
                 # information, such as determining the login alias(es), we'll add it to a dictionary as was done with
                 # the basic port information
-                for port_obj in port_stats['fibrechannel-statistics']:
-                    port_stats_d.update({port_obj['name']: port_obj})
+                port_stats_d = {port_obj['name']: port_obj for port_obj in port_stats['fibrechannel-statistics']}
 
         # Add all the ports to the database
         if ec == 0:  # Make sure we didn't encountered any errors above
@@ -219,17 +219,19 @@ def pseudo_main():
                 for k, v in port_stats_d[port_num].items():
                     _db_add(switch_wwn, port_num, k, v)
 
-    except:  # Bare because I don't care what went wrong. I just want to logout
+    except Exception as e:
         # The brcdapi_log.exception() method precedes the passed message parameter with a stack trace
-        brcdapi_log.exception('Unknown programming error occured while processing: ' + uri, True)
+        brcdapi_log.exception(['Unknown programming error occured while processing: ' + uri, 'Exception: ' + str(e)],
+                              True)
+        ec = -1
 
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if brcdapi_auth.is_error(obj):
-        brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
-        return -1
+    finally:  # I don't care what went wrong. I just want to logout
+        obj = brcdapi_rest.logout(session)
+        if brcdapi_auth.is_error(obj):
+            brcdapi_log.log('Logout failed:\n' + brcdapi_auth.formatted_error_msg(obj), True)
+            ec = -1
 
-    return 0
+    return ec
 
 
 ###################################################################
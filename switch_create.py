@@ -96,9 +96,12 @@ _DEBUG_ECHO = True  # When true, echoes details of ports being moved.
 _DEBUG_VERBOSE = False  # When True, all content and responses are formatted and printed (pprint).
 _DEBUG_BANNER = "This is a test banner."  # FOS only allows 0-9, a-z, A-Z, and - in the banner.
 _DEBUG_FAB_NAME = "Fabric_0"
+_DEBUG_LOG = '_logs'
+_DEBUG_NL = False
 
 
-def create_ls(session, fid, name, did, idid, xisl, base, ficon, ports, ge_ports, es, ep, echo):
+def create_ls(session, fid, name, did, idid, xisl, base, ficon, ports, ge_ports, es, ep, echo, fab_name=None,
+              banner=None):
     """Create a logical switch. Includes options to set a few basic parameters
 
     :param session: Session object returned from brcdapi.brcdapi_auth.login()
@@ -127,6 +130,10 @@ def create_ls(session, fid, name, did, idid, xisl, base, ficon, ports, ge_ports,
     :type ep: None, bool
     :param echo: If True, step-by-step activity (each request) is echoed to STD_OUT
     :type echo: None, bool
+    :param fab_name: Fabric name. Use None to leave the fabric name unchanged
+    :type fab_name: None, str
+    :param banner: Switch banner. Use None to leave the banner unchanged
+    :type banner: None, str
     :return: Error code. 0 - Success, -1 - failure
     :rtype: int
     """
@@ -166,10 +173,10 @@ def create_ls(session, fid, name, did, idid, xisl, base, ficon, ports, ge_ports,
         sub_content.update({'in-order-delivery-enabled': True, 'dynamic-load-sharing': 'two-hop-lossless-dls'})
     # I didn't bother with a fabric name or banner in the shell interface. I have no idea why the fabric name is set and
     # read in the switch parameters, but it is.
-    if _DEBUG_FAB_NAME is not None:
-        sub_content.update({'fabric-user-friendly-name': _DEBUG_FAB_NAME})
-    if _DEBUG_BANNER is not None:
-        sub_content.update({'banner': _DEBUG_BANNER})
+    if fab_name is not None:
+        sub_content.update({'fabric-user-friendly-name': fab_name})
+    if banner is not None:
+        sub_content.update({'banner': banner})
     # If there is nothing to update, the library will do nothing and return good status.
     obj = brcdapi_switch.fibrechannel_switch(session, fid, sub_content, None, echo)
     if brcdapi_auth.is_error(obj):
@@ -207,8 +214,9 @@ def create_ls(session, fid, name, did, idid, xisl, base, ficon, ports, ge_ports,
             ec = -1
 
     # Add the ports to the switch. This has to be done one FID at a time.
-    tl = list(ports.keys())  # The keys are the FIDs so this is the list of all FIDs that have ports to be moved.
-    tl.extend([k for k in ge_ports.keys() if k not in tl])  # Add FIDs for GE ports
+    # The keys are the FIDs so this is the list of all FIDs that have ports to be moved. dict.fromkeys() removes FIDs
+    # that have both FC and GE ports while preserving order.
+    tl = list(dict.fromkeys(list(ports.keys()) + list(ge_ports.keys())))
     for k in tl:  # For every FID with ports to move
         obj = brcdapi_switch.add_ports(session, fid, k, ports.get(k), ge_ports.get(k), echo)
         if brcdapi_auth.is_error(obj):
@@ -299,10 +307,11 @@ def _parse_ports(session, fid, i_ports, i_ge_ports, echo):
                 else:
                     input_slots = tl[0]
                     input_ports = tl[1]
+                # A single slot or port must be a list. Otherwise, iterating over it iterates over each character.
                 tl = input_slots.split('-')
-                slot_l = tl[0] if len(tl) == 1 else [str(i) for i in range(int(tl[0]), int(tl[1]) + 1)]
+                slot_l = [tl[0]] if len(tl) == 1 else [str(i) for i in range(int(tl[0]), int(tl[1]) + 1)]
                 tl = input_ports.split('-')
-                port_l = tl[0] if len(tl) == 1 else [str(i) for i in range(int(tl[0]), int(tl[1]) + 1)]
+                port_l = [tl[0]] if len(tl) == 1 else [str(i) for i in range(int(tl[0]), int(tl[1]) + 1)]
                 for s in slot_l:
                     d['port_l'].extend([s + '/' + p for p in port_l])
 
@@ -314,8 +323,10 @@ def _parse_ports(session, fid, i_ports, i_ge_ports, echo):
 
         # Step 3: Build the dictionaries for input to brcdapi_switch.add_ports()
         else:
-            # Build the dictionaries with the list of ports that match the user input by FID.
+            # Build the dictionaries with the list of ports that match the user input by FID. A set is used for the
+            # port membership test because every port in every FID is checked.
             for k, d in port_d.items():
+                port_s = set(d['port_l'])
                 for switch_d in switch_list:
                     x_fid = switch_d['fabric-id']
                     # We haven't created the logical switch yet so x_fid will never == fid in the test below. This
@@ -325,7 +336,7 @@ def _parse_ports(session, fid, i_ports, i_ge_ports, echo):
                     if x_fid != fid:
                         tl = list() if switch_d[d['ref']].get('port-member') is None else \
                             switch_d[d['ref']].get('port-member')
-                        d['ports'].update({x_fid: [p for p in tl if p in d['port_l']]})
+                        d['ports'].update({x_fid: [p for p in tl if p in port_s]})
 
     return port_d['ports']['ports'], port_d['ge_ports']['ports']
 
@@ -352,7 +363,7 @@ def parse_args():
 
     if _DEBUG:
         return _DEBUG_IP, _DEBUG_ID, _DEBUG_PW, _DEBUG_SEC, _DEBUG_FID, _DEBUG_NAME, _DEBUG_DID, _DEBUG_IDID, \
-               _DEBUG_XISL, _DEBUG_FICON, _DEBUG_BASE, _DEBUG_PORTS, _DEBUG_GE_PORTS, _DEBUG_SE, _DEBUG_PE, \
+               _DEBUG_XISL, _DEBUG_BASE, _DEBUG_FICON, _DEBUG_PORTS, _DEBUG_GE_PORTS, _DEBUG_SE, _DEBUG_PE, \
                _DEBUG_ECHO, _DEBUG_VERBOSE, _DEBUG_LOG, _DEBUG_NL
     else:
         parser = argparse.ArgumentParser(description='Create a logical switch.')
@@ -416,38 +427,29 @@ def pseudo_main():
         ml.append('Access:        HTTPS')
     if not nl:
         brcdapi_log.open_log(log)
-    try:
-        fid = int(fid)
-        if fid < 1 or fid > 128:
-            raise
-    except:
+    # In debug mode, the FID and DID may be integers so they are converted to str before checking for digits.
+    fid = int(fid) if str(fid).isdecimal() else 0
+    if fid < 1 or fid > 128:
         brcdapi_log.log('Invalid fid. FID must be an integer between 1-128', True)
         return -1
     if did is not None:
-        try:
-            did = int(did)
-            if did < 1 or did > 239:
-                raise
-        except:
+        did = int(did) if str(did).isdecimal() else 0
+        if did < 1 or did > 239:
             brcdapi_log.log('Invalid DID. DID must be an integer between 1-239', True)
             return -1
-    ml.append('FID:           ' + str(fid))
-    ml.append('Name:          ' + str(name))
-    ml.append('DID:           ' + str(did))
-    ml.append('Insistent:     ' + str(idid))
-    ml.append('xisl:          ' + str(xisl))
-    ml.append('base:          ' + str(base))
-    ml.append('ficon:         ' + str(ficon))
-    ml.append('ports:         ' + str(i_ports))
-    ml.append('ge_ports:      ' + str(i_ge_ports))
-    ml.append('Enable switch: ' + str(es))
-    ml.append('Enable ports:  ' + str(ep))
+    ml.extend(['FID:           ' + str(fid),
+               'Name:          ' + str(name),
+               'DID:           ' + str(did),
+               'Insistent:     ' + str(idid),
+               'xisl:          ' + str(xisl),
+               'base:          ' + str(base),
+               'ficon:         ' + str(ficon),
+               'ports:         ' + str(i_ports),
+               'ge_ports:      ' + str(i_ge_ports),
+               'Enable switch: ' + str(es),
+               'Enable ports:  ' + str(ep)])
     brcdapi_log.log(ml, True)
-    base = False if base is None else base
-    ficon = False if ficon is None else ficon
-    es = False if es is None else es
-    ep = False if ep is None else ep
-    echo = False if echo is None else echo
+    base, ficon, es, ep, echo = bool(base), bool(ficon), bool(es), bool(ep), bool(echo)
 
     # Login
     brcdapi_log.log('Attempting login', True)
@@ -463,16 +465,20 @@ def pseudo_main():
         port_d, ge_port_d = _parse_ports(session, fid, i_ports, i_ge_ports, echo)
 
         # We're done with conditioning the user input. Now create the logical switch.
-        ec = create_ls(session, fid, name, did, idid, xisl, base, ficon, port_d, ge_port_d, es, ep, echo)
+        # The fabric name and banner are not in the shell interface so they are only set in debug mode.
+        fab_name, banner = (_DEBUG_FAB_NAME, _DEBUG_BANNER) if _DEBUG else (None, None)
+        ec = create_ls(session, fid, name, did, idid, xisl, base, ficon, port_d, ge_port_d, es, ep, echo,
+                       fab_name=fab_name, banner=banner)
 
-    except:
-        brcdapi_log.log('Encountered a programming error', True)
+    except Exception as e:
+        brcdapi_log.exception(['Encountered a programming error', 'Exception: ' + str(e)], True)
         ec = -1
 
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if brcdapi_auth.is_error(obj):
-        brcdapi_log.log(['Logout failed. API error message is:',  brcdapi_auth.formatted_error_msg(obj)], True)
+    finally:  # Logout
+        obj = brcdapi_rest.logout(session)
+        if brcdapi_auth.is_error(obj):
+            brcdapi_log.log(['Logout failed. API error message is:',  brcdapi_auth.formatted_error_msg(obj)], True)
+
     return ec
 
 
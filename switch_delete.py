@@ -62,7 +62,6 @@ __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
 __version__ = '4.0.2'
 
-import argparse
 import brcdapi.brcdapi_rest as brcdapi_rest
 import brcdapi.fos_auth as fos_auth
 import brcdapi.log as brcdapi_log
@@ -147,14 +146,13 @@ def pseudo_main(ip, user_id, pw, sec, fid_l):
     except brcdapi_util.VirtualFabricIdError:
         brcdapi_log.log('Software error. Search the log for "Invalid FID" for details.', echo=True)
         ec = -1
-    except BaseException as e:
+    except Exception as e:
         brcdapi_log.exception(['Programming error encountered.', str(type(e)) + ': ' + str(e)], echo=True)
         ec = -1
-
-    # Logout
-    obj = brcdapi_rest.logout(session)
-    if fos_auth.is_error(obj):
-        brcdapi_log.log(['Logout failed. API error message is:',  fos_auth.formatted_error_msg(obj)], echo=True)
+    finally:  # Logout
+        obj = brcdapi_rest.logout(session)
+        if fos_auth.is_error(obj):
+            brcdapi_log.log(['Logout failed. API error message is:',  fos_auth.formatted_error_msg(obj)], echo=True)
 
     return ec
 
@@ -210,7 +208,7 @@ def _get_input():
 ###################################################################
 if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
-    exit(brcddb_common.EXIT_STATUS_OK)
+    exit(0)
 
 if _STAND_ALONE:
     _ec = _get_input()
@@ -39,15 +39,12 @@ __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
 __version__ = '4.0.2'
 
-import argparse
 import brcdapi.brcdapi_rest as brcdapi_rest
 import brcdapi.fos_auth as brcdapi_auth
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.zone as brcdapi_zone
-import brcdapi.file as brcdapi_file
 import brcdapi.util as brcdapi_util
-import brcdapi.excel_util as excel_util
 
 _DOC_STRING = False  # Should always be False. Prohibits any actual I/O. Only useful for building documentation
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
@@ -111,27 +108,27 @@ def pseudo_main(user_id, pw, ip, sec, fid, zone_cfg):
     if checksum is None:
         brcdapi_log.log('Could not get a valid checksum', echo=True)
         _logout(session)
-        ec = -1
+        return -1
 
-    else:
-        try:
-            brcdapi_log.log('Enabling zone configuration ' + zone_cfg + ', fid: ' + str(fid), echo=True)
-            obj = brcdapi_zone.enable_zonecfg(session, checksum, fid, zone_cfg, True)
-            if brcdapi_auth.is_error(obj):
-                # brcdapi_zone.enable_zonecfg() already printed the error messages so just abort the transaction
-                brcdapi_zone.abort(session, fid, True)
-                ec = -1
-
-        except brcdapi_util.VirtualFabricIdError:
-            brcdapi_log.log('Software error. Search the log for "Invalid FID" for details.', echo=True)
+    try:
+        brcdapi_log.log('Enabling zone configuration ' + zone_cfg + ', fid: ' + str(fid), echo=True)
+        obj = brcdapi_zone.enable_zonecfg(session, checksum, fid, zone_cfg, True)
+        if brcdapi_auth.is_error(obj):
+            # brcdapi_zone.enable_zonecfg() already printed the error messages so just abort the transaction
+            brcdapi_zone.abort(session, fid, True)
             ec = -1
 
-        except BaseException as e:
-            brcdapi_log.exception(['Programming error encountered.', 'Exception: (' + str(type(e)) + ') ' + str(e)],
-                                  echo=True)
-            ec = -1
+    except brcdapi_util.VirtualFabricIdError:
+        brcdapi_log.log('Software error. Search the log for "Invalid FID" for details.', echo=True)
+        ec = -1
+
+    except Exception as e:
+        brcdapi_log.exception(['Programming error encountered.', 'Exception: (' + str(type(e)) + ') ' + str(e)],
+                              echo=True)
+        ec = -1
 
-    _logout(session)
+    finally:
+        _logout(session)
 
     return ec
 
@@ -172,7 +169,8 @@ def _get_input():
         ]
     brcdapi_log.log(ml, echo=True)
 
-    return ec if ec != 0 else pseudo_main(args_id, args_pw, args_ip, args_s, args_fid, args_z)
+    return ec if ec != 0 else \
+        pseudo_main(args_d['id'], args_d['pw'], args_d['ip'], args_d['s'], args_d['fid'], args_d['z'])
 
 
 ###################################################################
@@ -182,7 +180,7 @@ def _get_input():
 ###################################################################
 if _DOC_STRING:
     print('_DOC_STRING is True. No processing')
-    exit(brcddb_common.EXIT_STATUS_OK)
+    exit(0)
 
 if _STAND_ALONE:
     _ec = _get_input()